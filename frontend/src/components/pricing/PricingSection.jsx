@@ -5,6 +5,25 @@ import { createFetcher } from "../../libs/fetcher";
 import config from "../../libs/config";
 import PageLoader from "../common/PageLoader";
 
+// Helper function to format price
+const formatPrice = (numericPrice) => {
+	return Math.abs(numericPrice) < 0.01 ? "0.00" : numericPrice.toFixed(2);
+};
+
+// Helper function to derive the displayed price and discount for each tier
+const buildTierViews = (tiers) => {
+	return Object.entries(tiers).map(([key, plan]) => {
+		const discount = parseFloat(plan.basePrice) - parseFloat(plan.price);
+
+		return {
+			key,
+			plan,
+			formattedPrice: formatPrice(parseFloat(plan.price)),
+			discount: discount >= 0.01 ? discount.toFixed(2) : null,
+		};
+	});
+};
+
 const PricingSection = () => {
 	const { data: pricingData, isLoading } = useQuery({
 		queryKey: ["pricing"],
@@ -15,6 +34,7 @@ const PricingSection = () => {
 
 		initialData: keepPreviousData,
 
+		staleTime: 30000,
 		refetchInterval: 30000,
 	});
 
@@ -26,24 +46,7 @@ const PricingSection = () => {
 		);
 	}
 
-	const tiers = pricingData?.tiers || {};
-
-	// Helper function to determine if there's a price discount
-	const hasDiscount = (basePrice, price) => {
-		return parseFloat(basePrice) > parseFloat(price);
-	};
-
-	// Helper function to calculate discount amount
-	const calculateDiscount = (basePrice, price) => {
-		const discount = parseFloat(basePrice) - parseFloat(price);
-		return Math.abs(discount) < 0.01 ? "0.00" : discount.toFixed(2);
-	};
-
-	// Helper function to format price
-	const formatPrice = (price) => {
-		const numericPrice = parseFloat(price);
-		return Math.abs(numericPrice) < 0.01 ? "0.00" : numericPrice.toFixed(2);
-	};
+	const tierViews = buildTierViews(pricingData?.tiers || {});
 
 	return (
 		<section id="pricing" className="relative py-20">
@@ -62,7 +65,7 @@ const PricingSection = () => {
 				</motion.div>
 
 				<div className="grid grid-cols-1 md:grid-cols-3 gap-y-12 md:gap-y-8 gap-x-8 max-w-6xl mx-auto">
-					{Object.entries(tiers).map(([key, plan]) => (
+					{tierViews.map(({ key, plan, formattedPrice, discount }) => (
 						<motion.div
 							key={key}
 							initial={{ opacity: 0, y: 20 }}
@@ -83,21 +86,20 @@ const PricingSection = () => {
 								<h3 className="text-2xl font-bold mb-2">{plan.name}</h3>
 								<p className="text-gray-400 mb-4 text-sm min-h-[3em]">{plan.description}</p>
 								<div className="flex flex-col items-center justify-center">
-									{hasDiscount(plan.basePrice, plan.price) &&
-									parseFloat(calculateDiscount(plan.basePrice, plan.price)) > 0 ? (
+									{discount ? (
 										<>
 											<div className="flex items-baseline">
 												<span className="text-2xl font-bold text-gray-500 line-through mr-2">${plan.basePrice}</span>
-												<span className="text-4xl font-bold text-green-400">${formatPrice(plan.price)}</span>
+												<span className="text-4xl font-bold text-green-400">${formattedPrice}</span>
 											</div>
 											<span className="text-sm text-green-400 font-semibold mt-1 px-2 py-0.5 bg-green-500/10 rounded-md">
-												Save ${calculateDiscount(plan.basePrice, plan.price)}! (One-Time Offer)
+												Save ${discount}! (One-Time Offer)
 											</span>
 											<span className="text-gray-400 ml-2 mt-1">/ {plan.billingPeriod}</span>
 										</>
 									) : (
 										<div className="flex items-baseline justify-center">
-											<span className="text-4xl font-bold">${formatPrice(plan.price)}</span>
+											<span className="text-4xl font-bold">${formattedPrice}</span>
 											<span className="text-gray-400 ml-2">/ {plan.billingPeriod}</span>
 										</div>
 									)}